@@ -0,0 +1,230 @@
+#!/bin/bash
+# BrightPath Latency Benchmark
+# Sends synthetic profiles to every prediction endpoint at a fixed concurrency and
+# records throughput and p50/p95/p99 latency to a JSON file for regression checks.
+#
+# Usage: ./benchmark.sh [requests] [concurrency] [baseline.json]
+#   BASE_URL  backend address        (default: http://localhost:8000)
+#   SEED      random seed for profiles (default: 42, same seed = same profiles)
+#   OUTPUT    results file            (default: benchmark_results.json)
+#
+# With a baseline, exits non-zero if any endpoint's p95 grows by more than 10% or its
+# error count goes up.
+
+BASE_URL=${BASE_URL:-http://localhost:8000}
+REQUESTS=${1:-50}
+CONCURRENCY=${2:-4}
+BASELINE=${3:-}
+SEED=${SEED:-42}
+OUTPUT=${OUTPUT:-benchmark_results.json}
+ROLE="Software Developer"
+ROLE_PATH="Software%20Developer"
+
+echo "================================================================================"
+echo "BRIGHTPATH LATENCY BENCHMARK"
+echo "================================================================================"
+echo "   Backend:     $BASE_URL"
+echo "   Requests:    $REQUESTS per endpoint"
+echo "   Concurrency: $CONCURRENCY"
+echo "   Seed:        $SEED"
+echo ""
+
+if ! curl -s "$BASE_URL/" > /dev/null 2>&1; then
+    echo "❌ Backend is NOT running"
+    echo "   Start with: cd backend && python -m uvicorn app.main:app --reload"
+    exit 1
+fi
+
+WORK_DIR=$(mktemp -d)
+trap 'rm -rf "$WORK_DIR"' EXIT
+
+# Writes $REQUESTS seeded profiles to <dir>/profile_<n>.json. Each field is drawn
+# uniformly from the range or options in fieldConfig (pages/CareerRecommendation.tsx).
+# Multi-select checkbox fields get 1-3 options joined with commas, as the form submits
+# them; Extra_courses_did gets exactly one of Yes/No.
+generate_profiles() {
+    python - "$1" "$REQUESTS" "$SEED" <<'PYEOF'
+import json
+import random
+import sys
+
+out_dir, count, seed = sys.argv[1], int(sys.argv[2]), int(sys.argv[3])
+random.seed(seed)
+
+NUMBERS = {
+    "Acedamic_percentage_in_Operating_Systems": (0, 100),
+    "Percentage_in_Algorithms": (0, 100),
+    "Percentage_in_Programming_Concepts": (0, 100),
+    "Percentage_in_Software_Engineering": (0, 100),
+    "Percentage_in_Computer_Networks": (0, 100),
+    "Percentage_in_Electronics_Subjects": (0, 100),
+    "Percentage_in_Computer_Architecture": (0, 100),
+    "Percentage_in_Mathematics": (0, 100),
+    "Percentage_in_Communication_skills": (0, 100),
+    "Hours_working_per_day": (1, 24),
+    "Logical_quotient_rating": (1, 10),
+    "Hackathons": (0, 10),
+    "Coding_skills_rating": (1, 10),
+    "Public_speaking_points": (1, 10),
+}
+RADIOS = {
+    "Can_work_long_time_before_system": ["yes", "no"],
+    "Self_learning_capability": ["yes", "no"],
+    "Reading_and_writing_skills": ["poor", "medium", "excellent"],
+    "Memory_capability_score": ["poor", "medium", "excellent"],
+    "Extra_courses_did": ["Yes", "No"],
+    "Interested_career_area": ["Business process analyst", "Cloud Computing", "Data engineering", "developer",
+                               "security", "system developer", "testing", "Web development"],
+    "Type_of_company_want_to_settle_in": ["BPA", "Cloud Services", "Finance", "IoT", "product development",
+                                          "Product based", "SAP", "Testing and Maintainance Services",
+                                          "Web Services"],
+    "Job_Higher_Studies": ["Job", "Higher Studies", "Both"],
+    "Management_or_Technical": ["Management", "Technical"],
+    "Hard_smart_worker": ["hard worker", "smart worker", "both"],
+    "Worked_in_teams_ever": ["yes", "no"],
+}
+CHECKBOXES = {
+    "Certifications": ["app development", "distro making", "full stack", "hadoop", "information security",
+                       "machine learning", "python", "r programming", "shell programming"],
+    "Workshops": ["cloud computing", "data science", "database security", "game development", "hacking",
+                  "system designing", "testing", "web technologies"],
+    "Interested_subjects": ["Cloud Computing", "Computer Architecture", "data engineering", "hacking", "IOT",
+                            "Management", "networks", "parallel computing", "programming", "security",
+                            "Software Engineering"],
+}
+
+for i in range(1, count + 1):
+    profile = {name: random.randint(low, high) for name, (low, high) in NUMBERS.items()}
+    profile.update({name: random.choice(options) for name, options in RADIOS.items()})
+    for name, options in CHECKBOXES.items():
+        # Keep the form's option order, which is how the selected checkboxes are joined
+        chosen = set(random.sample(options, random.randint(1, 3)))
+        profile[name] = ",".join(o for o in options if o in chosen)
+    with open(f"{out_dir}/profile_{i}.json", "w") as f:
+        json.dump(profile, f)
+PYEOF
+}
+
+echo "📋 Generating $REQUESTS synthetic profiles..."
+generate_profiles "$WORK_DIR" || exit 1
+echo "   ✓ Profiles ready"
+echo ""
+
+# Times one request; prints "<http status> <seconds>"
+timed_request() {
+    local method=$1 url=$2 profile=$3
+    if [ "$method" = "POST" ]; then
+        curl -s -o /dev/null -w '%{http_code} %{time_total}\n' -X POST "$url" \
+            -H "Content-Type: application/json" -d @"$profile"
+    else
+        curl -s -o /dev/null -w '%{http_code} %{time_total}\n' "$url"
+    fi
+}
+export -f timed_request
+
+# Runs one endpoint and prints its JSON stats object
+run_endpoint() {
+    local name=$1 method=$2 url=$3
+    local samples="$WORK_DIR/$name.txt"
+    local start end
+
+    echo -n "  - $name ... " >&2
+    start=$(date +%s.%N)
+    seq 1 "$REQUESTS" | xargs -P "$CONCURRENCY" -I{} \
+        bash -c 'timed_request "$0" "$1" "$2"' "$method" "$url" "$WORK_DIR/profile_{}.json" > "$samples"
+    end=$(date +%s.%N)
+
+    # Nearest-rank percentiles over successful requests only; null when none succeeded
+    local errors
+    errors=$(awk '$1 !~ /^2/' "$samples" | wc -l)
+    awk '$1 ~ /^2/ { print $2 * 1000 }' "$samples" | sort -n | awk -v start="$start" -v end="$end" -v errors="$errors" '
+        { ms[++n] = $1 }
+        END {
+            if (n > 0) {
+                p50 = sprintf("%.1f", ms[int((n - 1) * 0.50) + 1])
+                p95 = sprintf("%.1f", ms[int((n - 1) * 0.95) + 1])
+                p99 = sprintf("%.1f", ms[int((n - 1) * 0.99) + 1])
+            } else {
+                p50 = p95 = p99 = "null"
+            }
+            printf "{\"throughput_rps\": %.2f, \"p50_ms\": %s, \"p95_ms\": %s, \"p99_ms\": %s, \"errors\": %d}", \
+                n / (end - start), p50, p95, p99, errors
+        }'
+    echo "done" >&2
+}
+
+echo "🧪 Benchmarking endpoints..."
+PREDICT=$(run_endpoint predict_top3_careers POST "$BASE_URL/predict_top3_careers")
+XAI=$(run_endpoint xai_explanations POST "$BASE_URL/xai_explanations/$ROLE_PATH?generate_visualization=false")
+XAI_VIZ=$(run_endpoint xai_explanations_visualization POST "$BASE_URL/xai_explanations/$ROLE_PATH?generate_visualization=true")
+ROADMAP=$(run_endpoint career_roadmap GET "$BASE_URL/career_roadmap/$ROLE_PATH")
+EVOLUTION=$(run_endpoint predict_career_evolution POST "$BASE_URL/predict_career_evolution")
+echo ""
+
+cat > "$OUTPUT" <<EOF
+{
+  "timestamp": "$(date -u +%Y-%m-%dT%H:%M:%SZ)",
+  "base_url": "$BASE_URL",
+  "requests": $REQUESTS,
+  "concurrency": $CONCURRENCY,
+  "seed": $SEED,
+  "role": "$ROLE",
+  "endpoints": {
+    "predict_top3_careers": $PREDICT,
+    "xai_explanations": $XAI,
+    "xai_explanations_visualization": $XAI_VIZ,
+    "career_roadmap": $ROADMAP,
+    "predict_career_evolution": $EVOLUTION
+  }
+}
+EOF
+
+echo "================================================================================"
+echo "📊 Results (written to $OUTPUT)"
+echo "================================================================================"
+python - "$OUTPUT" "$BASELINE" <<'EOF'
+import json
+import sys
+
+current = json.load(open(sys.argv[1]))["endpoints"]
+baseline = json.load(open(sys.argv[2]))["endpoints"] if sys.argv[2] else {}
+
+
+def ms(value):
+    return f"{value:8.1f}" if value is not None else f"{'-':>8}"
+
+
+regressions = []
+print(f"{'endpoint':32} {'rps':>8} {'p50':>8} {'p95':>8} {'p99':>8} {'err':>5}")
+for name, stats in current.items():
+    print(f"{name:32} {stats['throughput_rps']:8.2f} {ms(stats['p50_ms'])} "
+          f"{ms(stats['p95_ms'])} {ms(stats['p99_ms'])} {stats['errors']:5d}")
+    if name not in baseline:
+        continue
+    base = baseline[name]
+    if base["p95_ms"] is not None and stats["p95_ms"] is not None:
+        change = (stats["p95_ms"] - base["p95_ms"]) / base["p95_ms"] * 100 if base["p95_ms"] else 0.0
+        regressed = change > 10
+        marker = "⚠️ " if regressed else "  "
+        print(f"  {marker}p95 vs baseline: {base['p95_ms']:.1f} ms -> {stats['p95_ms']:.1f} ms ({change:+.1f}%)")
+        if regressed:
+            regressions.append(f"{name}: p95 {change:+.1f}%")
+    elif base["p95_ms"] is not None:
+        print("  ⚠️ p95 vs baseline: no successful requests")
+        regressions.append(f"{name}: no successful requests")
+    regressed = stats["errors"] > base["errors"]
+    marker = "⚠️ " if regressed else "  "
+    print(f"  {marker}errors vs baseline: {base['errors']} -> {stats['errors']}")
+    if regressed:
+        regressions.append(f"{name}: errors {base['errors']} -> {stats['errors']}")
+
+if regressions:
+    print("")
+    print("❌ Regressions against baseline:")
+    for regression in regressions:
+        print(f"   • {regression}")
+    sys.exit(1)
+EOF
+STATUS=$?
+echo "================================================================================"
+exit $STATUS
@@ -13,6 +13,7 @@ import {
 } from 'chart.js'
 import { EnhancedRoadmapDisplay } from '../components/EnhancedRoadmapDisplay'
 import { apiUrl } from '../utils/api'
+import { fetchRoadmap, fetchXai } from '../utils/roleData'
 import { SkillGapAnalysis } from '../components/SkillGapAnalysis'
 
 ChartJS.register(CategoryScale, LinearScale, BarElement, Tooltip, Legend)
@@ -1076,20 +1077,8 @@ const api = {
     if (!res.ok) throw new Error(`API error: ${res.status}`)
     return res.json()
   },
-  xai: async (role: string, data: any): Promise<XAIResponse> => {
-    const res = await fetchWithTimeout(apiUrl(`/xai_explanations/${encodeURIComponent(role)}?generate_visualization=true`), {
-      method: 'POST',
-      headers: { 'Content-Type': 'application/json' },
-      body: JSON.stringify(data),
-    })
-    if (!res.ok) throw new Error(`API error: ${res.status}`)
-    return res.json()
-  },
-  roadmap: async (role: string, data: any): Promise<RoadmapResponse> => {
-    const res = await fetchWithTimeout(apiUrl(`/career_roadmap/${encodeURIComponent(role)}`), { timeoutMs: 20000 })
-    if (!res.ok) throw new Error(`API error: ${res.status}`)
-    return res.json()
-  },
+  xai: (role: string, data: any): Promise<XAIResponse> => fetchXai(role, data),
+  roadmap: (role: string, data: any): Promise<RoadmapResponse> => fetchRoadmap(role),
   evolution: async (data: any, role?: string): Promise<EvolutionResponse> => {
     const qs = role ? `?role=${encodeURIComponent(role)}` : ''
     const res = await fetchWithTimeout(apiUrl(`/predict_career_evolution${qs}`), {
@@ -15,6 +15,7 @@ import { EnhancedRoadmapDisplay } from '../components/EnhancedRoadmapDisplay'
 import { SkillGapAnalysis } from '../components/SkillGapAnalysis'
 import { fetchWithTimeout } from '../utils/http'
 import { apiUrl } from '../utils/api'
+import { fetchRoadmap, fetchXai } from '../utils/roleData'
 
 // Model Architecture Display Component
 function ModelArchitectureDisplay() {
@@ -543,13 +544,8 @@ export function Insights() {
       }
     }))
     try {
-      const [rdRes, xRes] = await Promise.all([
-        fetchWithTimeout(apiUrl(`/career_roadmap/${encodeURIComponent(r)}`), { timeoutMs: 20000 }),
-        fetchWithTimeout(apiUrl(`/xai_explanations/${encodeURIComponent(r)}?generate_visualization=true`), {
-          method: 'POST', headers: { 'Content-Type': 'application/json' }, body: JSON.stringify(formData), timeoutMs: 20000,
-        })
-      ])
-      const [rdData, xData] = await Promise.all([rdRes.json(), xRes.json()])
+      // Shared with the recommendation page, so roles already explained there are not re-requested
+      const [rdData, xData] = await Promise.all([fetchRoadmap(r), fetchXai(r, formData)])
       setRoleData(prev => ({
         ...prev,
         [r]: {
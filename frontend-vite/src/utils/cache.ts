@@ -0,0 +1,52 @@
+// Small in-memory LRU/TTL cache for backend responses that only depend on the
+// submitted profile (XAI explanations, roadmaps). Pending requests are shared,
+// so callers asking for the same key at the same time trigger one fetch.
+
+const MAX_ENTRIES = 64
+const TTL_MS = 10 * 60 * 1000
+
+type Entry = { value: Promise<unknown>, expiresAt: number }
+
+const entries = new Map<string, Entry>()
+
+function canonicalize(value: unknown): unknown {
+  if (Array.isArray(value)) return value.map(canonicalize)
+  if (value && typeof value === 'object') {
+    const out: Record<string, unknown> = {}
+    for (const k of Object.keys(value as Record<string, unknown>).sort()) {
+      out[k] = canonicalize((value as Record<string, unknown>)[k])
+    }
+    return out
+  }
+  return value
+}
+
+// Stable key for a profile: the same fields produce the same key regardless of key order
+export function profileKey(data: unknown): string {
+  return JSON.stringify(canonicalize(data ?? null))
+}
+
+export function cached<T>(key: string, load: () => Promise<T>): Promise<T> {
+  const now = Date.now()
+  const hit = entries.get(key)
+  if (hit && hit.expiresAt > now) {
+    // Refresh recency
+    entries.delete(key)
+    entries.set(key, hit)
+    return hit.value as Promise<T>
+  }
+  if (hit) entries.delete(key)
+
+  const value = load()
+  entries.set(key, { value, expiresAt: now + TTL_MS })
+  // Failed requests must not be served from cache
+  value.catch(() => {
+    if (entries.get(key)?.value === value) entries.delete(key)
+  })
+
+  while (entries.size > MAX_ENTRIES) {
+    const oldest = entries.keys().next().value as string
+    entries.delete(oldest)
+  }
+  return value
+}
@@ -0,0 +1,28 @@
+// Cached fetchers for per-role data shared by the recommendation and insights pages.
+// Cache keys are built only here so both pages always hit the same entries.
+
+import type { RoadmapResponse, XAIResponse } from '../types/api'
+import { apiUrl } from './api'
+import { cached, profileKey } from './cache'
+import { fetchWithTimeout } from './http'
+
+export function fetchRoadmap(role: string): Promise<RoadmapResponse> {
+  return cached(`roadmap|${role}`, async () => {
+    const res = await fetchWithTimeout(apiUrl(`/career_roadmap/${encodeURIComponent(role)}`), { timeoutMs: 20000 })
+    if (!res.ok) throw new Error(`API error: ${res.status}`)
+    return res.json()
+  })
+}
+
+export function fetchXai(role: string, profile: any): Promise<XAIResponse> {
+  return cached(`xai|${role}|${profileKey(profile)}`, async () => {
+    const res = await fetchWithTimeout(apiUrl(`/xai_explanations/${encodeURIComponent(role)}?generate_visualization=true`), {
+      method: 'POST',
+      headers: { 'Content-Type': 'application/json' },
+      body: JSON.stringify(profile),
+      timeoutMs: 20000,
+    })
+    if (!res.ok) throw new Error(`API error: ${res.status}`)
+    return res.json()
+  })
+}
@@ -1,6 +1,11 @@
 #!/bin/bash
 # Master Training Script - Trains all models and generates comprehensive documentation
 # Run this script to train all models, compare them, and generate research documentation
+# Stages whose script and data are unchanged since the last run are skipped (FORCE=1 retrains all)
+#
+# The MLP (train_model.py) trains in the background while the two Keras models train one
+# after the other. This assumes train_model.py writes no files that the evolution scripts
+# also read or write; set PARALLEL=0 to run every stage sequentially.
 
 echo "================================================================================"
 echo "BRIGHTPATH CAREER RECOMMENDATION SYSTEM"
@@ -17,38 +22,96 @@ pip install -q seaborn scikit-learn
 echo "   ✓ Packages ready"
 echo ""
 
-echo "================================================================================"
-echo "🧠 Step 2: Training MLP Career Recommendation Model"
-echo "================================================================================"
-python train_model.py
-if [ $? -eq 0 ]; then
-    echo "   ✅ MLP model trained successfully"
-else
-    echo "   ❌ MLP training failed"
-    exit 1
-fi
-echo ""
+# Stage fingerprints live here; a stage is skipped when its fingerprint is unchanged.
+# Set FORCE=1 to retrain everything.
+CACHE_DIR=".train_cache"
+mkdir -p "$CACHE_DIR"
+
+# Fingerprint of a stage: its script, the training data and any upstream fingerprints.
+# Fails if an input is missing so a stage is never fingerprinted without its data.
+fingerprint() {
+    for input in "$@"; do
+        if [ ! -f "$input" ]; then
+            echo "   ❌ Missing input: $input" >&2
+            return 1
+        fi
+    done
+    cat "$@" | sha256sum | cut -d' ' -f1
+}
+
+# Usage: is_fresh <stage> <fingerprint> <output files...>
+is_fresh() {
+    local stage=$1 hash=$2
+    shift 2
+    [ "$FORCE" = "1" ] && return 1
+    [ -n "$hash" ] || return 1
+    [ "$(cat "$CACHE_DIR/$stage.hash" 2>/dev/null)" = "$hash" ] || return 1
+    for output in "$@"; do
+        [ -f "$output" ] || return 1
+    done
+    return 0
+}
+
+# Usage: train_stage <stage> <script> <fingerprint> <output files...>
+# Output is copied to $CACHE_DIR/<stage>.log; with QUIET=1 it goes only to the log.
+train_stage() {
+    local stage=$1 script=$2 hash=$3 status
+    shift 3
+    if is_fresh "$stage" "$hash" "$@"; then
+        echo "   ⏭️  $stage unchanged since last run - skipping"
+        return 0
+    fi
+    echo "   ▶️  $stage training started (log: $CACHE_DIR/$stage.log)"
+    rm -f "$CACHE_DIR/$stage.hash"
+    if [ "$QUIET" = "1" ]; then
+        python "$script" > "$CACHE_DIR/$stage.log" 2>&1
+        status=$?
+    else
+        # Unbuffered so epoch progress reaches the console as it happens, not in bursts
+        python -u "$script" 2>&1 | tee "$CACHE_DIR/$stage.log"
+        status=${PIPESTATUS[0]}
+    fi
+    if [ $status -eq 0 ]; then
+        echo "$hash" > "$CACHE_DIR/$stage.hash"
+        echo "   ✅ $stage model trained successfully"
+    else
+        echo "   ❌ $stage training failed - see $CACHE_DIR/$stage.log"
+        # Streamed stages already printed their output; background ones only logged it
+        if [ "$QUIET" = "1" ]; then
+            tail -n 30 "$CACHE_DIR/$stage.log"
+        fi
+        return 1
+    fi
+}
+
+MLP_HASH=$(fingerprint train_model.py data/roo.csv) || exit 1
+LSTM_HASH=$(fingerprint train_evolution_model.py data/roo.csv) || exit 1
+TRANSFORMER_HASH=$(fingerprint train_evolution_advanced.py data/roo.csv) || exit 1
+
+# Keep TensorFlow from reserving all GPU memory while the MLP trains alongside it
+export TF_FORCE_GPU_ALLOW_GROWTH=true
 
 echo "================================================================================"
-echo "🔄 Step 3: Training LSTM Career Evolution Model"
+echo "🧠 Steps 2-4: Training MLP, LSTM and Transformer Models"
 echo "================================================================================"
-python train_evolution_model.py
-if [ $? -eq 0 ]; then
-    echo "   ✅ LSTM model trained successfully"
+FAILED=0
+if [ "$PARALLEL" = "0" ]; then
+    train_stage mlp train_model.py "$MLP_HASH" career_model.pkl mlp_training_metrics.json || exit 1
 else
-    echo "   ❌ LSTM training failed"
-    exit 1
+    # The MLP runs in the background, logging only, while the Keras models train in order
+    QUIET=1 train_stage mlp train_model.py "$MLP_HASH" career_model.pkl mlp_training_metrics.json &
+    MLP_PID=$!
 fi
-echo ""
-
-echo "================================================================================"
-echo "🚀 Step 4: Training Advanced Transformer Model"
-echo "================================================================================"
-python train_evolution_advanced.py
-if [ $? -eq 0 ]; then
-    echo "   ✅ Transformer model trained successfully"
+if train_stage lstm train_evolution_model.py "$LSTM_HASH" career_evolution_model.h5 lstm_training_metrics.json; then
+    train_stage transformer train_evolution_advanced.py "$TRANSFORMER_HASH" \
+        career_evolution_advanced.h5 time_prediction_model.h5 transformer_training_metrics.json || FAILED=1
 else
-    echo "   ❌ Transformer training failed"
+    FAILED=1
+fi
+if [ -n "$MLP_PID" ]; then
+    wait "$MLP_PID" || FAILED=1
+fi
+if [ $FAILED -ne 0 ]; then
     exit 1
 fi
 echo ""
@@ -56,22 +119,52 @@ echo ""
 echo "================================================================================"
 echo "📊 Step 5: Comparing Models"
 echo "================================================================================"
-python model_comparison.py
-if [ $? -eq 0 ]; then
-    echo "   ✅ Model comparison complete"
+# Downstream steps fingerprint the produced models and metrics, so any retrain reruns them.
+# If an artifact is missing the step always runs and nothing is recorded.
+MODEL_ARTIFACTS=(
+    career_model.pkl career_evolution_model.h5 career_evolution_advanced.h5 time_prediction_model.h5
+    mlp_training_metrics.json lstm_training_metrics.json transformer_training_metrics.json
+)
+if ! COMPARISON_HASH=$(fingerprint model_comparison.py "${MODEL_ARTIFACTS[@]}" 2>&1); then
+    echo "   ⚠️  ${COMPARISON_HASH# *❌ } - running without cache"
+    COMPARISON_HASH=""
+fi
+if is_fresh comparison "$COMPARISON_HASH" model_comparison_report.json; then
+    echo "   ⏭️  Models unchanged since last comparison - skipping"
 else
-    echo "   ⚠️  Model comparison failed (non-critical)"
+    rm -f "$CACHE_DIR/comparison.hash"
+    python model_comparison.py
+    if [ $? -eq 0 ]; then
+        if [ -n "$COMPARISON_HASH" ]; then
+            echo "$COMPARISON_HASH" > "$CACHE_DIR/comparison.hash"
+        fi
+        echo "   ✅ Model comparison complete"
+    else
+        echo "   ⚠️  Model comparison failed (non-critical)"
+    fi
 fi
 echo ""
 
 echo "================================================================================"
 echo "📝 Step 6: Generating Research Documentation"
 echo "================================================================================"
-python generate_research_documentation.py
-if [ $? -eq 0 ]; then
-    echo "   ✅ Research documentation generated"
+if ! DOCS_HASH=$(fingerprint generate_research_documentation.py "${MODEL_ARTIFACTS[@]}" model_comparison_report.json 2>&1); then
+    echo "   ⚠️  ${DOCS_HASH# *❌ } - running without cache"
+    DOCS_HASH=""
+fi
+if is_fresh documentation "$DOCS_HASH" RESEARCH_DOCUMENTATION.md; then
+    echo "   ⏭️  Results unchanged since last run - skipping"
 else
-    echo "   ⚠️  Documentation generation failed (non-critical)"
+    rm -f "$CACHE_DIR/documentation.hash"
+    python generate_research_documentation.py
+    if [ $? -eq 0 ]; then
+        if [ -n "$DOCS_HASH" ]; then
+            echo "$DOCS_HASH" > "$CACHE_DIR/documentation.hash"
+        fi
+        echo "   ✅ Research documentation generated"
+    else
+        echo "   ⚠️  Documentation generation failed (non-critical)"
+    fi
 fi
 echo ""
 